@@ -1,10 +1,42 @@
 from django.contrib import admin
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Count, Q
+from django.utils.text import smart_split, unescape_string_literal
 from .models import (
     Category, Tag, UserProfile, News, Comment, 
     Like, ReadingHistory, NewsletterSubscription, ContactMessage,EmailTemplate
 )
 
 
+def is_changelist_request(request):
+    """True when the admin is rendering a changelist rather than a change form"""
+    match = request.resolver_match
+    return match is not None and (match.url_name or '').endswith('_changelist')
+
+
+def search_bits(search_term):
+    """Split an admin search term into words the same way ModelAdmin.get_search_results does"""
+    for bit in smart_split(search_term):
+        if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+            bit = unescape_string_literal(bit)
+        yield bit
+
+
+class CategoryFilter(admin.SimpleListFilter):
+    """Category filter built from the small categories table, reading only id and name"""
+    title = 'category'
+    parameter_name = 'category'
+
+    def lookups(self, request, model_admin):
+        return Category.objects.values_list('id', 'name')
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(category_id=self.value())
+        return queryset
+
+
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'slug', 'is_active', 'created_at']
@@ -23,17 +55,22 @@ class TagAdmin(admin.ModelAdmin):
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'role', 'is_verified', 'created_at']
+    list_select_related = ['user']
     list_filter = ['role', 'is_verified', 'created_at']
     search_fields = ['user__username', 'user__email']
 
 
 @admin.register(News)
 class NewsAdmin(admin.ModelAdmin):
-    list_display = ['title', 'author', 'category', 'status', 'priority', 'created_at', 'published_at']
-    list_filter = ['status', 'priority', 'category', 'created_at', 'published_at']
-    search_fields = ['title', 'content', 'author__username']
+    list_display = ['title', 'author', 'category', 'status', 'priority', 'comment_count', 'created_at', 'published_at']
+    list_select_related = ['author', 'category', 'reviewed_by']
+    show_full_result_count = False
+    list_filter = ['status', 'priority', CategoryFilter, 'created_at', 'published_at']
+    # content is searched through search_vector in get_search_results
+    search_fields = ['title', 'author__username']
     prepopulated_fields = {'slug': ('title',)}
-    filter_horizontal = ['tags']
+    # Users and tags are fetched on demand instead of rendered as full <select> lists
+    autocomplete_fields = ['author', 'category', 'reviewed_by', 'tags']
     date_hierarchy = 'created_at'
     
     fieldsets = (
@@ -56,23 +93,85 @@ class NewsAdmin(admin.ModelAdmin):
         })
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            # Count comments in the changelist query instead of once per row,
+            # and leave the large text columns the list never shows unloaded
+            queryset = queryset.annotate(_comment_count=Count('comments')).defer(
+                'content', 'excerpt', 'review_notes', 'meta_description', 'meta_keywords', 'search_vector'
+            )
+        return queryset
+
+    def get_search_results(self, request, queryset, search_term):
+        bits = list(search_bits(search_term))
+        if not bits:
+            return queryset, False
+        # Each branch filters a single table, so PostgreSQL can BitmapOr the
+        # trigram and full-text indexes instead of scanning news joined to auth_user
+        term_filter = Q()
+        for bit in bits:
+            term_filter &= (
+                Q(pk__in=News.objects.filter(title__icontains=bit).values('pk'))
+                | Q(author_id__in=User.objects.filter(username__icontains=bit).values('pk'))
+            )
+        term_filter |= Q(pk__in=News.objects.filter(
+            search_vector=SearchQuery(search_term, config='english', search_type='websearch')
+        ).values('pk'))
+        return queryset.filter(term_filter), False
+
+    @admin.display(description='Comments', ordering='_comment_count')
+    def comment_count(self, obj):
+        return obj._comment_count
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
-    list_display = ['article', 'author', 'created_at']
+    list_display = ['article', 'author', 'reply_count', 'created_at']
+    list_select_related = ['article', 'author']
+    show_full_result_count = False
     list_filter = ['created_at']
     search_fields = ['content', 'author__username', 'article__title']
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            queryset = queryset.annotate(_reply_count=Count('replies')).defer('content')
+        return queryset
+
+    def get_search_results(self, request, queryset, search_term):
+        bits = list(search_bits(search_term))
+        if not bits:
+            return queryset, False
+        # Single-table branches keep the trigram indexes on comment content
+        # and news title usable instead of filtering after the joins
+        term_filter = Q()
+        for bit in bits:
+            term_filter &= (
+                Q(pk__in=Comment.objects.filter(content__icontains=bit).values('pk'))
+                | Q(author_id__in=User.objects.filter(username__icontains=bit).values('pk'))
+                | Q(article_id__in=News.objects.filter(title__icontains=bit).values('pk'))
+            )
+        return queryset.filter(term_filter), False
+
+    @admin.display(description='Replies', ordering='_reply_count')
+    def reply_count(self, obj):
+        return obj._reply_count
+
 
 @admin.register(Like)
 class LikeAdmin(admin.ModelAdmin):
     list_display = ['user', 'article', 'comment', 'created_at']
+    list_select_related = ['user', 'article', 'comment__author', 'comment__article']
+    show_full_result_count = False
     list_filter = ['created_at']
 
 
 @admin.register(ReadingHistory)
 class ReadingHistoryAdmin(admin.ModelAdmin):
     list_display = ['user', 'article', 'read_at']
+    list_select_related = ['user', 'article']
+    show_full_result_count = False
     list_filter = ['read_at']
     search_fields = ['user__username', 'article__title']
 
@@ -80,6 +179,7 @@ class ReadingHistoryAdmin(admin.ModelAdmin):
 @admin.register(NewsletterSubscription)
 class NewsletterSubscriptionAdmin(admin.ModelAdmin):
     list_display = ['email', 'user', 'is_active', 'created_at']
+    list_select_related = ['user']
     list_filter = ['is_active', 'created_at']
     search_fields = ['email']
 
@@ -2,25 +2,30 @@
 Cloudinary utilities for optimizing URL storage
 """
 import re
+from functools import lru_cache
 from django.conf import settings
 
 
+# Matches both http and https Cloudinary delivery URLs up to the cloud name
+CLOUDINARY_BASE_RE = re.compile(r'https?://res\.cloudinary\.com/[^/]+/')
+
+
+@lru_cache(maxsize=1)
+def _cloudinary_base_url():
+    """Resolve the Cloudinary base URL once; settings do not change at runtime"""
+    if hasattr(settings, 'CLOUDINARY_STORAGE') and 'CLOUD_NAME' in settings.CLOUDINARY_STORAGE:
+        cloud_name = settings.CLOUDINARY_STORAGE['CLOUD_NAME']
+        return f"https://res.cloudinary.com/{cloud_name}/"
+    return None
+
+
 class CloudinaryUtils:
     """Utility class for handling Cloudinary URLs"""
     
-    # Common Cloudinary base URL patterns
-    CLOUDINARY_BASE_PATTERNS = [
-        r'https://res\.cloudinary\.com/[^/]+/',
-        r'http://res\.cloudinary\.com/[^/]+/',
-    ]
-    
     @classmethod
     def get_cloudinary_base_url(cls):
         """Get the base Cloudinary URL from settings"""
-        if hasattr(settings, 'CLOUDINARY_STORAGE') and 'CLOUD_NAME' in settings.CLOUDINARY_STORAGE:
-            cloud_name = settings.CLOUDINARY_STORAGE['CLOUD_NAME']
-            return f"https://res.cloudinary.com/{cloud_name}/"
-        return None
+        return _cloudinary_base_url()
     
     @classmethod
     def strip_base_url(cls, full_url):
@@ -35,11 +40,14 @@ class CloudinaryUtils:
         """
         if not full_url:
             return full_url
+        
+        # Stored paths are already stripped, so skip the regex for them
+        if 'res.cloudinary.com' not in full_url:
+            return full_url
             
-        for pattern in cls.CLOUDINARY_BASE_PATTERNS:
-            match = re.match(pattern, full_url)
-            if match:
-                return full_url[len(match.group(0)):]
+        match = CLOUDINARY_BASE_RE.match(full_url)
+        if match:
+            return full_url[match.end():]
         
         return full_url
     
@@ -61,7 +69,7 @@ class CloudinaryUtils:
         if resource_path.startswith(('http://', 'https://')):
             return resource_path
             
-        base_url = cls.get_cloudinary_base_url()
+        base_url = _cloudinary_base_url()
         if base_url:
             return f"{base_url}{resource_path}"
         
@@ -78,6 +86,9 @@ class CloudinaryUtils:
         Returns:
             str: Optimized URL for storage (resource path only)
         """
+        # Values loaded back from the database are already resource paths
+        if not cloudinary_url or not cloudinary_url.startswith(('http://', 'https://')):
+            return cloudinary_url
         return cls.strip_base_url(cloudinary_url)
     
     @classmethod
@@ -1,66 +1,146 @@
-import json
+import hashlib
+import logging
+import re
+import time
+from urllib.parse import unquote_plus
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
-from channels.db import database_sync_to_async
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth import get_user_model
 import jwt
 from django.conf import settings
+from .user_cache import get_cached_user
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+# JWT verification parameters, resolved once instead of through LazySettings per decode
+JWT_KEY = settings.SECRET_KEY.encode() if isinstance(settings.SECRET_KEY, str) else settings.SECRET_KEY
+JWT_ALGORITHMS = ['HS256']
+JWT_OPTIONS = {'verify_aud': False, 'verify_iss': False, 'require': ['exp']}
+
+# Decoded JWT payloads are reused for a few seconds to absorb reconnect storms
+TOKEN_CACHE_TTL = 5
+TOKEN_CACHE_MAXSIZE = 10000
+_token_cache = {}
+
+TOKEN_QUERY_RE = re.compile(rb'(?:^|&)token=([^&]*)')
+
+NOTIFICATION_SUBSCRIPTION_RE = re.compile(r'\bnotificationAdded\b')
+
+# graphql-ws frames that differ only by subscription id and payload are
+# filled in by substitution instead of building and serializing a dict
+CONNECTION_ACK_FRAME = '{"type": "connection_ack"}'
+PONG_FRAME = '{"type": "pong"}'
+NOTIFICATION_FRAME_TEMPLATE = '{"id": %s, "type": "data", "payload": {"data": {"notificationAdded": %s}}}'
+
+
+def is_notification_subscription(query):
+    """Whether a subscription document selects notificationAdded"""
+    return NOTIFICATION_SUBSCRIPTION_RE.search(query) is not None
+
+
+def decode_token(token):
+    """
+    Verify and decode a JWT, reusing the payload for repeated handshakes
+    with the same token. Entries never outlive the token's own expiry.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    cached = _token_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    payload = jwt.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS, options=JWT_OPTIONS)
+    
+    ttl = TOKEN_CACHE_TTL
+    if 'exp' in payload:
+        ttl = min(ttl, payload['exp'] - time.time())
+    if ttl > 0:
+        if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+            _token_cache.clear()
+        _token_cache[key] = (now + ttl, payload)
+    return payload
+
 
 class GraphQLSubscriptionConsumer(AsyncWebsocketConsumer):
     """
     Custom GraphQL Subscription Consumer for notifications
     """
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.subscription_id = None
+        self.subscription_id_json = None
+        self.group_name = None
+        # Client message type -> handler, looked up once per frame
+        self.message_handlers = {
+            'start': self.handle_subscription_start,
+            'stop': self.handle_subscription_stop,
+            'ping': self.handle_ping,
+        }
+    
     async def connect(self):
-        print(f"WebSocket connection attempt from {self.scope.get('client', ['unknown', 'unknown'])[0]}")
+        # Resolve the level once so the diagnostics below cost nothing when debug is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("WebSocket connection attempt from %s", self.scope.get('client', ['unknown', 'unknown'])[0])
         
         # Get token from connection params or headers
         token = None
         
         # Check subprotocols for token (graphql-ws protocol)
-        subprotocols = self.scope.get('subprotocols', [])
-        headers = dict(self.scope.get('headers', []))
-        print(f"Subprotocols: {subprotocols}")
-        print(f"Headers: {headers}")
+        headers = self.scope.get('headers', [])
+        if debug:
+            logger.debug("Subprotocols: %s", self.scope.get('subprotocols', []))
+            logger.debug("Headers: %s", headers)
         
-        # Try to get token from Authorization header
-        auth_header = headers.get(b'authorization', b'').decode()
-        if auth_header.startswith('Bearer '):
-            token = auth_header[7:]  # Remove 'Bearer ' prefix
-            print(f"Token from Authorization header: {token[:20]}..." if token else "No token")
+        # Try to get token from Authorization header (scan instead of building a dict)
+        auth_header = b''
+        for name, value in headers:
+            if name == b'authorization':
+                auth_header = value
+                break
+        if auth_header.startswith(b'Bearer '):
+            token = auth_header[7:].decode()  # Remove 'Bearer ' prefix
+            if debug:
+                logger.debug("Token from Authorization header: %s...", token[:20] if token else "none")
         
-        # If no token in headers, try query string
-        if not token:
-            query_string = self.scope.get('query_string', b'').decode()
-            print(f"Query string: {query_string}")
-            if 'token=' in query_string:
-                token = query_string.split('token=')[1].split('&')[0]
-                print(f"Token from query string: {token[:20]}..." if token else "No token")
+        # If no token in headers, try query string; most anonymous connections
+        # carry no token at all, so a substring test skips the regex for them
+        query_string = self.scope.get('query_string', b'')
+        if not token and b'token=' in query_string:
+            if debug:
+                logger.debug("Query string: %s", query_string)
+            # Match the exact key on the raw bytes and only unquote the captured value
+            match = TOKEN_QUERY_RE.search(query_string)
+            if match and match.group(1):
+                token = unquote_plus(match.group(1).decode())
+                if debug:
+                    logger.debug("Token from query string: %s...", token[:20])
         
         # For development, allow connections without tokens
         if not token:
-            print("No token provided, allowing anonymous connection for development")
+            logger.debug("No token provided, allowing anonymous connection for development")
             self.user = AnonymousUser()
         else:
             # Verify JWT token
             try:
-                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+                payload = decode_token(token)
                 user_id = payload.get('user_id')
-                user = await self.get_user(user_id)
+                user = await get_cached_user(user_id)
                 
                 if not user or not user.is_active:
-                    print(f"Invalid user or inactive user: {user_id}")
+                    logger.debug("Invalid user or inactive user: %s", user_id)
                     await self.close()
                     return
                     
                 self.user = user
-                print(f"User authenticated: {user.username}")
+                logger.debug("User authenticated: %s", user.username)
                 
             except (jwt.InvalidTokenError, User.DoesNotExist) as e:
-                print(f"JWT token error: {e}")
+                logger.debug("JWT token error: %s", e)
                 # For development, allow connection with anonymous user
                 self.user = AnonymousUser()
         
@@ -75,17 +155,15 @@ class GraphQLSubscriptionConsumer(AsyncWebsocketConsumer):
             self.channel_name
         )
         
-        print("Accepting WebSocket connection with subprotocol: graphql-ws")
+        logger.debug("Accepting WebSocket connection with subprotocol: graphql-ws")
         await self.accept(subprotocol='graphql-ws')
         
         # Send connection ack
-        await self.send(text_data=json.dumps({
-            'type': 'connection_ack'
-        }))
-        print("WebSocket connection established and ack sent")
+        await self.send(text_data=CONNECTION_ACK_FRAME)
+        logger.debug("WebSocket connection established and ack sent")
         
     async def disconnect(self, close_code):
-        if hasattr(self, 'group_name'):
+        if self.group_name:
             # Leave notification group
             await self.channel_layer.group_discard(
                 self.group_name,
@@ -95,53 +173,41 @@ class GraphQLSubscriptionConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """Handle incoming messages from client"""
         try:
-            message = json.loads(text_data)
-            message_type = message.get('type')
+            message = orjson.loads(text_data)
+        except orjson.JSONDecodeError:
+            return
+        
+        handler = self.message_handlers.get(message.get('type'))
+        if handler:
+            await handler(message)
+    
+    async def handle_subscription_start(self, message):
+        """Client starting a subscription"""
+        payload = message.get('payload', {})
+        query = payload.get('query', '')
+        
+        # Check if it's a notification subscription
+        if is_notification_subscription(query):
+            # Store subscription ID for this connection
+            self.subscription_id = message.get('id')
+            self.subscription_id_json = orjson.dumps(self.subscription_id).decode()
             
-            if message_type == 'start':
-                # Client starting a subscription
-                payload = message.get('payload', {})
-                query = payload.get('query', '')
-                
-                # Check if it's a notification subscription
-                if 'notificationAdded' in query:
-                    # Store subscription ID for this connection
-                    self.subscription_id = message.get('id')
-                    
-                    # Send immediate response that subscription is active
-                    await self.send(text_data=json.dumps({
-                        'id': self.subscription_id,
-                        'type': 'data',
-                        'payload': {
-                            'data': {
-                                'notificationAdded': None
-                            }
-                        }
-                    }))
-                    
-            elif message_type == 'stop':
-                # Client stopping a subscription
-                self.subscription_id = None
-                
-        except json.JSONDecodeError:
-            pass
+            # Send immediate response that subscription is active
+            await self.send(text_data=NOTIFICATION_FRAME_TEMPLATE % (self.subscription_id_json, 'null'))
+    
+    async def handle_subscription_stop(self, message):
+        """Client stopping a subscription"""
+        self.subscription_id = None
+        self.subscription_id_json = None
+    
+    async def handle_ping(self, message):
+        """Keep-alive ping from the client"""
+        await self.send(text_data=PONG_FRAME)
     
     async def notification_message(self, event):
         """Handle notification messages from group"""
-        if hasattr(self, 'subscription_id') and self.subscription_id:
-            await self.send(text_data=json.dumps({
-                'id': self.subscription_id,
-                'type': 'data',
-                'payload': {
-                    'data': {
-                        'notificationAdded': event['notification']
-                    }
-                }
-            }))
-    
-    @database_sync_to_async
-    def get_user(self, user_id):
-        try:
-            return User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            return None
+        if self.subscription_id:
+            # The producer serialized the notification once for the whole group
+            await self.send(text_data=NOTIFICATION_FRAME_TEMPLATE % (
+                self.subscription_id_json, event['notification_json']
+            ))
@@ -30,10 +30,22 @@ class Command(BaseCommand):
         # Check Redis connection
         try:
             r = redis.Redis(host='127.0.0.1', port=6379, decode_responses=True)
-            r.ping()
+            # One round-trip for the ping and the connection headroom stats
+            pipe = r.pipeline(transaction=False)
+            pipe.ping()
+            pipe.info('clients')
+            pipe.config_get('maxclients')
+            ping_ok, clients_info, max_clients = pipe.execute(raise_on_error=False)
+            if isinstance(ping_ok, Exception):
+                raise ping_ok
             self.stdout.write(
                 self.style.SUCCESS('✅ Redis: Connected and responding')
             )
+            if not isinstance(clients_info, Exception):
+                self.stdout.write(f'   Connected clients: {clients_info.get("connected_clients")}')
+            # CONFIG is often disabled on managed Redis
+            if not isinstance(max_clients, Exception):
+                self.stdout.write(f'   Max clients: {max_clients.get("maxclients")}')
         except Exception as e:
             self.stdout.write(
                 self.style.WARNING(f'⚠️  Redis: Connection failed - {e}')
@@ -1,10 +1,40 @@
 from django.core.management.base import BaseCommand
 import asyncio
 import websockets
-import json
 import time
 
 
+# Most queued lines written to stdout in one call
+OUTPUT_BATCH_SIZE = 64
+
+# Longest frame excerpt printed per message
+FRAME_DISPLAY_LIMIT = 512
+
+CONNECTION_INIT_FRAME = '{"type": "connection_init"}'
+
+# Queued after the last line to tell drain_output to finish
+OUTPUT_DONE = object()
+
+
+def format_frame(message, limit=FRAME_DISPLAY_LIMIT):
+    """
+    Render a received frame for display, truncated so large payloads
+    (article bodies, long lists) cost the same as small ones
+    """
+    if len(message) <= limit:
+        excerpt, extra = message, 0
+    else:
+        excerpt, extra = message[:limit], len(message) - limit
+    if isinstance(excerpt, bytes):
+        excerpt = excerpt.decode('utf-8', 'replace')
+    # Keep one frame on one line even if it carries control characters
+    if not excerpt.isprintable():
+        excerpt = excerpt.encode('unicode_escape').decode('ascii')
+    if extra:
+        excerpt = f"{excerpt}...(+{extra} more)"
+    return excerpt
+
+
 class Command(BaseCommand):
     help = 'Monitor WebSocket connections for GraphQL subscriptions'
 
@@ -21,24 +51,74 @@ class Command(BaseCommand):
     async def monitor_websocket(self):
         uri = "ws://localhost:8000/graphql/"
         
+        # The reader only formats and queues lines; stdout I/O happens in drain_output.
+        # When the queue is full behind a slow terminal, frames are dropped and
+        # counted instead of blocking the reader
+        lines = asyncio.Queue(maxsize=10000)
+        writer = asyncio.create_task(self.drain_output(lines))
+        dropped = 0
+        
         try:
             async with websockets.connect(
                 uri, 
                 subprotocols=['graphql-ws'],
-                extra_headers={'Authorization': 'Bearer test-token'}
+                extra_headers={'Authorization': 'Bearer test-token'},
+                # The monitor only displays frames; skip permessage-deflate and cap frame size
+                max_size=2**20,
+                compression=None
             ) as websocket:
-                self.stdout.write(f"Connected to {uri}")
+                await lines.put(f"Connected to {uri}")
                 
                 # Send connection init
-                await websocket.send(json.dumps({
-                    'type': 'connection_init'
-                }))
+                await websocket.send(CONNECTION_INIT_FRAME)
                 
                 # Listen for messages
+                last_second = None
+                timestamp = ''
                 async for message in websocket:
-                    data = json.loads(message)
-                    timestamp = time.strftime("%H:%M:%S")
-                    self.stdout.write(f"[{timestamp}] Received: {data}")
+                    # Frames are already JSON text; show them as received
+                    # instead of decoding and re-rendering them
+                    # Only re-run strftime when the second changes
+                    now = int(time.time())
+                    if now != last_second:
+                        last_second = now
+                        timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+                        # At most one drop summary per second
+                        if dropped:
+                            try:
+                                lines.put_nowait(f"[{timestamp}] Dropped {dropped} frames (output too slow)")
+                                dropped = 0
+                            except asyncio.QueueFull:
+                                pass
+                    try:
+                        lines.put_nowait(f"[{timestamp}] Received: {format_frame(message)}")
+                    except asyncio.QueueFull:
+                        dropped += 1
                     
         except Exception as e:
-            self.stdout.write(f"WebSocket connection failed: {e}")
+            await lines.put(f"WebSocket connection failed: {e}")
+        finally:
+            if dropped:
+                await lines.put(f"Dropped {dropped} frames (output too slow)")
+            # Let the drain task write everything queued, in order, before returning
+            await lines.put(OUTPUT_DONE)
+            await writer
+
+    async def drain_output(self, lines):
+        """
+        Write queued lines in batches from a worker thread so a slow
+        terminal never stalls the WebSocket reader
+        """
+        write = self.stdout.write
+        while True:
+            batch = [await lines.get()]
+            while len(batch) < OUTPUT_BATCH_SIZE and not lines.empty():
+                batch.append(lines.get_nowait())
+            # OUTPUT_DONE is queued last, so it can only end a batch
+            done = batch[-1] is OUTPUT_DONE
+            if done:
+                batch.pop()
+            if batch:
+                await asyncio.to_thread(write, '\n'.join(batch))
+            if done:
+                return
@@ -1,4 +1,4 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
 from api.models import News, Notification
 from api.notification_service import NotificationService
@@ -14,9 +14,18 @@ class Command(BaseCommand):
             help='User ID to send test notification to',
             required=True
         )
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=1,
+            help='Number of test notifications to send',
+        )
 
     def handle(self, *args, **options):
         user_id = options['user_id']
+        count = options['count']
+        if count < 1:
+            raise CommandError('--count must be at least 1')
         
         try:
             user = User.objects.get(id=user_id)
@@ -26,21 +35,28 @@ class Command(BaseCommand):
             )
             return
 
-        # Create a test notification
-        notification = Notification.objects.create(
-            recipient=user,
-            notification_type='article_published',
-            title='Test Notification',
-            message=f'This is a test real-time notification for {user.username}!',
-        )
+        # Create the test notifications in one INSERT
+        notifications = Notification.objects.bulk_create([
+            Notification(
+                recipient=user,
+                notification_type='article_published',
+                title='Test Notification' if count == 1 else f'Test Notification #{i}',
+                message=f'This is a test real-time notification for {user.username}!',
+            )
+            for i in range(1, count + 1)
+        ], batch_size=500)
 
-        # Send real-time notification
-        NotificationService._send_realtime_notification(user.id, notification)
+        # Send real-time notifications in one pass over the channel layer
+        NotificationService._send_realtime_notifications([
+            (user.id, NotificationService._notification_event(notification))
+            for notification in notifications
+        ])
 
         self.stdout.write(
             self.style.SUCCESS(
-                f'Successfully sent test notification to {user.username} (ID: {user.id})'
+                f'Successfully sent {count} test notification(s) to {user.username} (ID: {user.id})'
             )
         )
-        self.stdout.write(f'Notification ID: {notification.id}')
-        self.stdout.write(f'Message: {notification.message}')
+        for notification in notifications:
+            self.stdout.write(f'Notification ID: {notification.id}')
+        self.stdout.write(f'Message: {notifications[0].message}')
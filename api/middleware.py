@@ -0,0 +1,20 @@
+"""
+GraphQL middleware
+"""
+from graphql_jwt.middleware import JSONWebTokenMiddleware
+
+
+class SelectiveJWTMiddleware(JSONWebTokenMiddleware):
+    """
+    JWT middleware that only authenticates root fields.
+
+    Graphene runs middleware for every field resolver. Nested fields
+    inherit the user that was put on the request context while resolving
+    their root field, so re-running the token and session lookups for
+    them is wasted work.
+    """
+
+    def resolve(self, next, root, info, **kwargs):
+        if info.path.prev is not None:
+            return next(root, info, **kwargs)
+        return super().resolve(next, root, info, **kwargs)
@@ -0,0 +1,36 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_news_search_vector_idx'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE TRIGGER api_news_search_vector_update
+                BEFORE INSERT OR UPDATE OF title, excerpt, content ON api_news
+                FOR EACH ROW EXECUTE FUNCTION
+                tsvector_update_trigger(search_vector, 'pg_catalog.english', title, excerpt, content);
+
+                UPDATE api_news SET search_vector = to_tsvector(
+                    'pg_catalog.english',
+                    coalesce(title, '') || ' ' || coalesce(excerpt, '') || ' ' || coalesce(content, '')
+                );
+            """,
+            reverse_sql="DROP TRIGGER IF EXISTS api_news_search_vector_update ON api_news;",
+        ),
+    ]
@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth.models import User
 from django.utils import timezone
 from cloudinary.models import CloudinaryField
@@ -157,12 +160,19 @@ class News(models.Model):
     meta_description = models.CharField(max_length=160, blank=True)
     meta_keywords = models.CharField(max_length=255, blank=True)
 
+    # Full-text search document over title, excerpt and content; kept up to
+    # date by a database trigger (see migration 0006)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ['-published_at', '-created_at']
         indexes = [
             models.Index(fields=['status', 'published_at']),
             models.Index(fields=['category', 'published_at']),
             models.Index(fields=['author', 'created_at']),
+            # Trigram index matching the UPPER(...) LIKE '%q%' that admin search issues
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='api_news_title_trgm_idx'),
+            GinIndex(fields=['search_vector'], name='api_news_search_vector_idx'),
         ]
 
     def __str__(self):
@@ -249,6 +259,7 @@ class Comment(models.Model):
             models.Index(fields=['article', 'created_at']),
             models.Index(fields=['author', 'created_at']),
             models.Index(fields=['parent', 'created_at']),
+            GinIndex(OpClass(Upper('content'), name='gin_trgm_ops'), name='api_comment_content_trgm_idx'),
         ]
     
     def __str__(self):
@@ -3,7 +3,8 @@ from django.utils import timezone
 from .models import News, Notification
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
-import json
+import asyncio
+import orjson
 
 
 class NotificationService:
@@ -33,39 +34,60 @@ class NotificationService:
                 article=article
             )
             notifications_created.append(notification)
-            
-            # Send real-time notification
-            NotificationService._send_realtime_notification(manager.id, notification)
+        
+        # Send real-time notifications in one pass over the channel layer
+        NotificationService._send_realtime_notifications([
+            (notification.recipient_id, NotificationService._notification_event(notification))
+            for notification in notifications_created
+        ])
         
         return notifications_created
     
     @staticmethod
-    def _send_realtime_notification(user_id, notification):
+    def _notification_event(notification, include_article=True):
+        """
+        Build the channel layer event for a notification, serialized once
+        so every consumer in the group can forward it as-is
+        """
+        notification_data = {
+            'id': str(notification.id),
+            'message': notification.message,
+            'notificationType': notification.notification_type,
+            'createdAt': notification.created_at.isoformat(),
+        }
+        if include_article:
+            notification_data['article'] = {
+                'slug': notification.article.slug
+            } if notification.article else None
+        
+        return {
+            'type': 'notification_message',
+            'notification_json': orjson.dumps(notification_data).decode()
+        }
+    
+    @staticmethod
+    def _send_realtime_notifications(events):
         """
-        Send real-time notification via WebSocket
+        Send (user_id, event) pairs via WebSocket using a single sync-to-async hop
         """
         channel_layer = get_channel_layer()
-        if channel_layer:
-            # Serialize notification data
-            notification_data = {
-                'id': str(notification.id),
-                'message': notification.message,
-                'notificationType': notification.notification_type,
-                'createdAt': notification.created_at.isoformat(),
-                'article': {
-                    'slug': notification.article.slug if notification.article else None
-                } if notification.article else None
-            }
+        if channel_layer and events:
+            async def send_all():
+                await asyncio.gather(*(
+                    channel_layer.group_send(f'notifications_{user_id}', event)
+                    for user_id, event in events
+                ))
             
-            # Send to user's group
-            group_name = f'notifications_{user_id}'
-            async_to_sync(channel_layer.group_send)(
-                group_name,
-                {
-                    'type': 'notification_message',
-                    'notification': notification_data
-                }
-            )
+            async_to_sync(send_all)()
+    
+    @staticmethod
+    def _send_realtime_notification(user_id, notification):
+        """
+        Send real-time notification via WebSocket
+        """
+        NotificationService._send_realtime_notifications([
+            (user_id, NotificationService._notification_event(notification))
+        ])
     
     @staticmethod
     def notify_writer_of_approval(article, approved_by):
@@ -170,9 +192,12 @@ class NotificationService:
                 message=f'{form_data.name} has submitted  for contact.',
             )
             notifications_created.append(notification)
-            
-            # Send real-time notification
-            NotificationService._send_realtime_notification_admin(manager.id, notification)
+        
+        # Send real-time notifications in one pass over the channel layer
+        NotificationService._send_realtime_notifications([
+            (notification.recipient_id, NotificationService._notification_event(notification, include_article=False))
+            for notification in notifications_created
+        ])
         
         return notifications_created
     
@@ -181,22 +206,6 @@ class NotificationService:
         """
         Send real-time notification via WebSocket
         """
-        channel_layer = get_channel_layer()
-        if channel_layer:
-            # Serialize notification data
-            notification_data = {
-                'id': str(notification.id),
-                'message': notification.message,
-                'notificationType': notification.notification_type,
-                'createdAt': notification.created_at.isoformat(),
-            }
-            
-            # Send to user's group
-            group_name = f'notifications_{user_id}'
-            async_to_sync(channel_layer.group_send)(
-                group_name,
-                {
-                    'type': 'notification_message',
-                    'notification': notification_data
-                }
-            )
\ No newline at end of file
+        NotificationService._send_realtime_notifications([
+            (user_id, NotificationService._notification_event(notification, include_article=False))
+        ])
\ No newline at end of file
@@ -21,6 +21,8 @@ from datetime import timedelta
 from django.utils import timezone
 from mail.send_mail import send_html_email
 from django.template import Template, Context
+from django.db import connection
+import threading
 
 class UserType(DjangoObjectType):
     """
@@ -125,7 +127,7 @@ class NewsType(DjangoObjectType):
     
     class Meta:
         model = News
-        exclude = ['featured_image']  # Exclude the CloudinaryField from auto-generation
+        exclude = ['featured_image', 'search_vector']  # Exclude the CloudinaryField and search document from auto-generation
     
     def resolve_featured_image_url(self, info):
         """
@@ -2522,6 +2524,35 @@ class CreateReadingHistory(graphene.Mutation):
         except Exception as e:
             return CreateReadingHistory(success=False, errors="Unexpected error: " + str(e))
 
+# Compiled email templates by pk, recompiled only when the row's updated_at changes
+_compiled_email_templates = {}
+
+
+def get_compiled_email_template(template_obj):
+    """
+    Return a parsed Template for an EmailTemplate row without re-lexing its HTML on every send
+    """
+    cached = _compiled_email_templates.get(template_obj.pk)
+    if cached is None or cached[0] != template_obj.updated_at:
+        cached = (template_obj.updated_at, Template(template_obj.html_content))
+        _compiled_email_templates[template_obj.pk] = cached
+    return cached[1]
+
+
+def send_contact_email(contact_id, to_email, subject, html_content):
+    """
+    Send the contact confirmation email and record the result; runs on a
+    background thread so the request does not wait on the SMTP round-trip
+    """
+    try:
+        success, _ = send_html_email(to_email=to_email, subject=subject, html_content=html_content)
+        if success:
+            ContactMessage.objects.filter(pk=contact_id).update(email_sent=True)
+    finally:
+        # The thread opened its own DB connection; don't leak it
+        connection.close()
+
+
 class CreateContact(graphene.Mutation):
     class Arguments:
         name = graphene.String(required=True)
@@ -2558,16 +2589,16 @@ class CreateContact(graphene.Mutation):
         })
         template_obj = EmailTemplate.objects.get(id=1)  # Assuming template ID 1 is the contact confirmation template
         # Render HTML template with context
-        template = Template(template_obj.html_content)
+        template = get_compiled_email_template(template_obj)
         rendered_html = template.render(context)
-        # send the email
-        success, msg = send_html_email(to_email=email,subject=template_obj.subject, html_content=rendered_html)
-
-        if success:
-            contact.email_sent = True
-            contact.save(update_fields=["email_sent"])
-
-        return CreateContact(success=success, message=msg)
+        # send the email in the background; email_sent is set once SMTP succeeds
+        threading.Thread(
+            target=send_contact_email,
+            args=(contact.id, email, template_obj.subject, rendered_html),
+            daemon=True,
+        ).start()
+
+        return CreateContact(success=True, message="Email is being sent")
     
 class UpdateEmailTemplate(graphene.Mutation):
     """
@@ -0,0 +1,45 @@
+"""
+In-process cache of active users for WebSocket handshakes
+"""
+import time
+from channels.db import database_sync_to_async
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+User = get_user_model()
+
+# Seconds a user stays cached; bounds staleness for changes made in other processes
+USER_CACHE_TTL = 30
+USER_CACHE_MAXSIZE = 10000
+
+_users = {}
+
+
+@database_sync_to_async
+def _load_user(user_id):
+    return User.objects.only('id', 'username', 'is_active').filter(pk=user_id).first()
+
+
+async def get_cached_user(user_id):
+    """
+    Return the user for a WebSocket handshake, only touching the ORM
+    when the entry is missing or older than USER_CACHE_TTL
+    """
+    now = time.monotonic()
+    cached = _users.get(user_id)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    user = await _load_user(user_id)
+    if user:
+        if len(_users) >= USER_CACHE_MAXSIZE:
+            _users.clear()
+        _users[user_id] = (now + USER_CACHE_TTL, user)
+    return user
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop a user's entry as soon as it changes in this process"""
+    _users.pop(instance.pk, None)
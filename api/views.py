@@ -1,4 +1,5 @@
-from django.http import JsonResponse
+import json
+from django.http import HttpResponse
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
@@ -12,14 +13,18 @@ from .serializers import (
 )
 
 
+# The health check body never changes, so serialize it once at import time
+HEALTH_CHECK_BODY = json.dumps({
+    'status': 'healthy',
+    'message': 'Newsor API is running successfully'
+}).encode()
+
+
 def health_check(request):
     """
     Simple health check endpoint
     """
-    return JsonResponse({
-        'status': 'healthy',
-        'message': 'Newsor API is running successfully'
-    })
+    return HttpResponse(HEALTH_CHECK_BODY, content_type='application/json')
 
 
 class UserRegistrationView(APIView):
@@ -28,7 +28,7 @@ class NewsType(DjangoObjectType):
     
     class Meta:
         model = DjangoNews
-        exclude = ['featured_image']
+        exclude = ['featured_image', 'search_vector']
     
     def resolve_featured_image_url(self, info):
         if self.featured_image:
@@ -11,20 +11,17 @@ import os
 from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
 from django.core.asgi import get_asgi_application
-from django.urls import path
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'newsor.settings')
 
 # Import after Django setup
 django_asgi_app = get_asgi_application()
 
-from api.consumers import GraphQLSubscriptionConsumer
+from api.routing import websocket_urlpatterns
 
 application = ProtocolTypeRouter({
     'http': django_asgi_app,
     'websocket': AuthMiddlewareStack(
-        URLRouter([
-            path('graphql/', GraphQLSubscriptionConsumer.as_asgi()),
-        ])
+        URLRouter(websocket_urlpatterns)
     ),
 })